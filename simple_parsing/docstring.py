@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import dataclasses
 import functools
 import inspect
 
@@ -101,30 +102,43 @@ def get_attribute_docstring(
     return created_docstring
 
 
-@functools.lru_cache(2048)
 def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocString | None:
     """Gets the AttributeDocString of the given field in the given dataclass.
     Doesn't inspect base classes.
     """
+    attribute_docstrings = _get_attribute_docstrings(dataclass)
+    if attribute_docstrings is None or field_name not in attribute_docstrings:
+        return None
+    # NOTE: Return a copy, since the cached values shouldn't be modified.
+    return dataclasses.replace(attribute_docstrings[field_name])
+
+
+@functools.lru_cache(2048)
+def _get_attribute_docstrings(dataclass: type) -> dict[str, AttributeDocString] | None:
+    """Gets the AttributeDocString of all the fields defined in the given dataclass.
+    Doesn't inspect base classes.
+
+    The source code of the class is only parsed once, and the result is cached, rather than
+    parsing it again for each field.
+    """
     try:
         source = inspect_getsource(dataclass)
     except (TypeError, OSError) as e:
         logger.debug(
             UserWarning(
                 f"Couldn't retrieve the source code of class {dataclass} "
-                f"(in order to retrieve the docstring of field {field_name}): {e}"
+                f"(in order to retrieve the docstring of its fields): {e}"
             )
         )
         return None
 
     # Parse docstring to use as help strings
-    desc_from_cls_docstring = ""
+    desc_from_cls_docstring: dict[str, str] = {}
     cls_docstring = inspect_getdoc(dataclass)
     if cls_docstring:
         docstring: Docstring = dp_parse(cls_docstring)
         for param in docstring.params:
-            if param.arg_name == field_name:
-                desc_from_cls_docstring = param.description or ""
+            desc_from_cls_docstring[param.arg_name] = param.description or ""
 
     # NOTE: We want to skip the docstring lines.
     # NOTE: Currently, we just remove the __doc__ from the source. It's perhaps a bit crude,
@@ -134,31 +148,26 @@ def _get_attribute_docstring(dataclass: type, field_name: str) -> AttributeDocSt
         # note: does this remove the whitespace though?
 
     code_lines: list[str] = source.splitlines()
-    # the first line is the class definition (OR the decorator!), we skip it.
-    start_line_index = 1
-    # starting at the second line, there might be the docstring for the class.
-    # We want to skip over that until we reach an attribute definition.
-    while start_line_index < len(code_lines):
-        if _contains_field_definition(code_lines[start_line_index]):
-            break
-        start_line_index += 1
-
-    lines_with_field_defs = [
-        (index, line) for index, line in enumerate(code_lines) if _contains_field_definition(line)
-    ]
-    for i, line in lines_with_field_defs:
-        if _line_contains_definition_for(line, field_name):
-            # we found the line with the definition of this field.
-            comment_above = _get_comment_ending_at_line(code_lines, i - 1)
-            comment_inline = _get_inline_comment_at_line(code_lines, i)
-            docstring_below = _get_docstring_starting_at_line(code_lines, i + 1)
-            return AttributeDocString(
-                comment_above,
-                comment_inline,
-                docstring_below,
-                desc_from_cls_docstring=desc_from_cls_docstring,
-            )
-    return None
+
+    attribute_docstrings: dict[str, AttributeDocString] = {}
+    for i, line in enumerate(code_lines):
+        if not _contains_field_definition(line):
+            continue
+        field_name = line.strip().partition(":")[0].strip()
+        if field_name in attribute_docstrings:
+            # Only keep the first definition of that field, like before.
+            continue
+        # we found the line with the definition of this field.
+        comment_above = _get_comment_ending_at_line(code_lines, i - 1)
+        comment_inline = _get_inline_comment_at_line(code_lines, i)
+        docstring_below = _get_docstring_starting_at_line(code_lines, i + 1)
+        attribute_docstrings[field_name] = AttributeDocString(
+            comment_above,
+            comment_inline,
+            docstring_below,
+            desc_from_cls_docstring=desc_from_cls_docstring.get(field_name, ""),
+        )
+    return attribute_docstrings
 
 
 def _contains_field_definition(line: str) -> bool:
@@ -213,15 +222,6 @@ def _contains_field_definition(line: str) -> bool:
     return field_name.isidentifier()
 
 
-def _line_contains_definition_for(line: str, field_name: str) -> bool:
-    line = line.strip()
-    if not _contains_field_definition(line):
-        return False
-    attribute, _, type_and_value_assignment = line.partition(":")
-    attribute = attribute.strip()  # remove any whitespace after the attribute name.
-    return attribute.isidentifier() and attribute == field_name
-
-
 def _is_empty(line_str: str) -> bool:
     return line_str.strip() == ""
 
@@ -139,6 +139,9 @@ class BooleanOptionalAction(argparse.Action):
         )
         self.type: Callable[[str], bool]
         assert self.type is not None
+        # The value to set when a flag is used without a value, e.g. `--my_flag` / `--nomy_flag`.
+        self._bare_flag_values: dict[str, bool] = dict.fromkeys(option_strings, True)
+        self._bare_flag_values.update(dict.fromkeys(self.negative_option_strings, False))
 
     def __call__(
         self,
@@ -150,18 +153,17 @@ class BooleanOptionalAction(argparse.Action):
         # NOTE: `option_string` is only None when using a positional argument.
         if option_string is None:
             raise NotImplementedError("This action doesn't support positional arguments yet.")
-        assert option_string in self.option_strings
-
-        used_negative_flag = option_string in self.negative_option_strings
+        assert option_string in self._bare_flag_values
 
         bool_value: bool
         if values is None:  # --my_flag / --nomy_flag
-            bool_value = not used_negative_flag
-        elif used_negative_flag:  # Cannot set `--nomy_flag=True/False`
+            bool_value = self._bare_flag_values[option_string]
+        elif not self._bare_flag_values[option_string]:  # Cannot set `--nomy_flag=True/False`
             parser.exit(
                 message=f"Negative flags cannot be passed a value (Got: {option_string}={values})"
             )
         elif isinstance(values, bool):
+            # argparse already converted the value with `self.type`.
             bool_value = values
         elif isinstance(values, str):  # --my_flag true
             bool_value = self.type(values)
@@ -12,7 +12,7 @@ import sys
 import typing
 from argparse import SUPPRESS, Action, HelpFormatter, Namespace, _
 from collections import defaultdict
-from logging import getLogger
+from logging import DEBUG, getLogger
 from pathlib import Path
 from typing import Any, Callable, Sequence, Type, overload
 
@@ -332,7 +332,7 @@ class ArgumentParser(argparse.ArgumentParser):
         assert isinstance(args, list)
         self._preprocessing(args=args, namespace=namespace)
 
-        logger.debug(f"Parser {id(self)} is parsing args: {args}, namespace: {namespace}")
+        logger.debug("Parser %s is parsing args: %s, namespace: %s", id(self), args, namespace)
         parsed_args, unparsed_args = super().parse_known_args(args, namespace)
 
         if unparsed_args and self._subparsers and attempt_to_reorder:
@@ -531,8 +531,10 @@ class ArgumentParser(argparse.ArgumentParser):
         # Create one argument group per dataclass
         for wrapped_dataclass in wrapped_dataclasses:
             logger.debug(
-                f"Parser {id(self)} is Adding arguments for dataclass: {wrapped_dataclass.dataclass} "
-                f"at destinations {wrapped_dataclass.destinations}"
+                "Parser %s is Adding arguments for dataclass: %s at destinations %s",
+                id(self),
+                wrapped_dataclass.dataclass,
+                wrapped_dataclass.destinations,
             )
             wrapped_dataclass.add_arguments(parser=self)
 
@@ -563,7 +565,7 @@ class ArgumentParser(argparse.ArgumentParser):
             i.e. with `parser.add_argument(...)`.
         """
         logger.debug("\nPOST PROCESSING\n")
-        logger.debug(f"(raw) parsed args: {parsed_args}")
+        logger.debug("(raw) parsed args: %s", parsed_args)
 
         self._remove_subgroups_from_namespace(parsed_args)
         # create the constructor arguments for each instance by consuming all
@@ -635,9 +637,12 @@ class ArgumentParser(argparse.ArgumentParser):
         for current_nesting_level in itertools.count():
             # Do rounds of parsing with just the subgroup arguments, until all the subgroups
             # are resolved to a dataclass type.
-            logger.debug(
-                f"Starting subgroup parsing round {current_nesting_level}: {list(unresolved_subgroups.keys())}"
-            )
+            if logger.isEnabledFor(DEBUG):
+                logger.debug(
+                    "Starting subgroup parsing round %s: %s",
+                    current_nesting_level,
+                    list(unresolved_subgroups.keys()),
+                )
             # Add all the unresolved subgroups arguments.
             for dest, subgroup_field in unresolved_subgroups.items():
                 flags = subgroup_field.option_strings
@@ -655,7 +660,7 @@ class ArgumentParser(argparse.ArgumentParser):
                     argument_options["default"] = argparse.SUPPRESS
 
                 logger.debug(
-                    f"Adding subgroup argument: add_argument(*{flags} **{str(argument_options)})"
+                    "Adding subgroup argument: add_argument(*%s **%s)", flags, argument_options
                 )
                 subgroup_choice_parser.add_argument(*flags, **argument_options)
 
@@ -664,8 +669,11 @@ class ArgumentParser(argparse.ArgumentParser):
                 args=args, namespace=namespace
             )
             logger.debug(
-                f"Nesting level {current_nesting_level}: args: {args}, "
-                f"parsed_args: {parsed_args}, unused_args: {unused_args}"
+                "Nesting level %s: args: %s, parsed_args: %s, unused_args: %s",
+                current_nesting_level,
+                args,
+                parsed_args,
+                unused_args,
             )
 
             for dest, subgroup_field in list(unresolved_subgroups.items()):
@@ -683,8 +691,9 @@ class ArgumentParser(argparse.ArgumentParser):
                 # chosen dataclass type (as we're doing below).
                 # subgroup_field.set_default(chosen_subgroup_key)
                 logger.debug(
-                    f"resolved the subgroup at {dest!r}: will use the subgroup at key "
-                    f"{chosen_subgroup_key!r}"
+                    "resolved the subgroup at %r: will use the subgroup at key %r",
+                    dest,
+                    chosen_subgroup_key,
                 )
 
                 default_or_dataclass_fn = subgroup_dict[chosen_subgroup_key]
@@ -744,18 +753,21 @@ class ArgumentParser(argparse.ArgumentParser):
             unresolved_subgroups = {
                 k: v for k, v in all_subgroup_fields.items() if k not in resolved_subgroups
             }
-            logger.debug(f"All subgroups: {list(all_subgroup_fields.keys())}")
-            logger.debug(f"Resolved subgroups: {resolved_subgroups}")
-            logger.debug(f"Unresolved subgroups: {list(unresolved_subgroups.keys())}")
+            if logger.isEnabledFor(DEBUG):
+                # NOTE: Only create the lists of keys when they will actually be logged.
+                logger.debug("All subgroups: %s", list(all_subgroup_fields.keys()))
+                logger.debug("Resolved subgroups: %s", resolved_subgroups)
+                logger.debug("Unresolved subgroups: %s", list(unresolved_subgroups.keys()))
 
             if not unresolved_subgroups:
                 logger.debug("Done parsing all the subgroups!")
                 break
             else:
                 logger.debug(
-                    f"Done parsing a round of subparsers at nesting level "
-                    f"{current_nesting_level}. Moving to the next round which has "
-                    f"{len(unresolved_subgroups)} unresolved subgroup choices."
+                    "Done parsing a round of subparsers at nesting level %s. Moving to the next "
+                    "round which has %s unresolved subgroup choices.",
+                    current_nesting_level,
+                    len(unresolved_subgroups),
                 )
         return wrappers, resolved_subgroups
 
@@ -828,10 +840,10 @@ class ArgumentParser(argparse.ArgumentParser):
         assert len(sorted_dc_wrappers) == len(set(sorted_dc_wrappers))
 
         for dc_wrapper in sorted_dc_wrappers:
-            logger.info(f"Instantiating the wrapper with destinations {dc_wrapper.destinations}")
+            logger.info("Instantiating the wrapper with destinations %s", dc_wrapper.destinations)
 
             for destination in dc_wrapper.destinations:
-                logger.info(f"Instantiating the dataclass at destination {destination}")
+                logger.info("Instantiating the dataclass at destination %s", destination)
                 # Instantiate the dataclass by passing the constructor arguments
                 # to the constructor.
                 constructor = dc_wrapper.dataclass_fn
@@ -852,22 +864,26 @@ class ArgumentParser(argparse.ArgumentParser):
 
                 if argparse.SUPPRESS in dc_wrapper.defaults and value_for_dataclass_field is None:
                     logger.debug(
-                        f"Suppressing entire destination {destination} because none of its"
-                        f"subattributes were specified on the command line."
+                        "Suppressing entire destination %s because none of its "
+                        "subattributes were specified on the command line.",
+                        destination,
                     )
 
                 elif dc_wrapper.parent is not None:
                     parent_key, attr = utils.split_dest(destination)
                     logger.debug(
-                        f"Setting a value of {value_for_dataclass_field} at attribute {attr} in "
-                        f"parent at key {parent_key}."
+                        "Setting a value of %s at attribute %s in parent at key %s.",
+                        value_for_dataclass_field,
+                        attr,
+                        parent_key,
                     )
                     constructor_arguments[parent_key][attr] = value_for_dataclass_field
 
                 elif not hasattr(parsed_args, destination):
                     logger.debug(
-                        f"setting attribute '{destination}' on the Namespace "
-                        f"to a value of {value_for_dataclass_field}"
+                        "setting attribute '%s' on the Namespace to a value of %s",
+                        destination,
+                        value_for_dataclass_field,
                     )
                     setattr(parsed_args, destination, value_for_dataclass_field)
 
@@ -876,8 +892,11 @@ class ArgumentParser(argparse.ArgumentParser):
                     existing = getattr(parsed_args, destination)
                     if dc_wrapper.dest in self._defaults:
                         logger.debug(
-                            f"Overwriting defaults in the namespace at destination '{destination}' "
-                            f"on the Namespace ({existing}) to a value of {value_for_dataclass_field}"
+                            "Overwriting defaults in the namespace at destination '%s' on the "
+                            "Namespace (%s) to a value of %s",
+                            destination,
+                            existing,
+                            value_for_dataclass_field,
                         )
                         setattr(parsed_args, destination, value_for_dataclass_field)
                     else:
@@ -934,29 +953,33 @@ class ArgumentParser(argparse.ArgumentParser):
         # The output
         constructor_arguments = initial_constructor_arguments.copy()
 
+        # NOTE: `vars` returns the `__dict__` of the namespace itself (not a copy), so popping values
+        # from it also removes them from `parsed_args`.
         parsed_arg_values = vars(parsed_args)
         deleted_values: dict[str, Any] = {}
 
         for wrapper in wrappers:
+            # NOTE: These don't change between the fields of a wrapper, so we only check them once.
+            is_suppressed = argparse.SUPPRESS in wrapper.defaults
             for field in wrapper.fields:
-                if argparse.SUPPRESS in wrapper.defaults and field.dest not in parsed_args:
-                    continue
-
                 if field.is_subgroup:
                     # Skip the subgroup fields, since we added a child DataclassWrapper for them.
-                    logger.debug(f"Not calling the subgroup FieldWrapper for dest {field.dest}")
+                    logger.debug("Not calling the subgroup FieldWrapper for field %s", field)
                     continue
 
-                if not field.field.init:
-                    # The field isn't an argument of the dataclass constructor.
+                dest = field.dest
+                if dest in parsed_arg_values:
+                    # NOTE: If the field is reused (when using the ConflictResolution.ALWAYS_MERGE
+                    # strategy), then we store the multiple values in the `dest` of the first
+                    # field. They are they distributed in `constructor_arguments` using the
+                    # `field.destinations`, which gives the destination for each value.
+                    values = parsed_arg_values.pop(dest)
+                elif is_suppressed:
                     continue
-
-                # NOTE: If the field is reused (when using the ConflictResolution.ALWAYS_MERGE
-                # strategy), then we store the multiple values in the `dest` of the first field.
-                # They are they distributed in `constructor_arguments` using the
-                # `field.destinations`, which gives the destination for each value.
-                values = parsed_arg_values.pop(field.dest, field.default)
-                deleted_values[field.dest] = values
+                else:
+                    # Only fetch the default value when it's actually needed.
+                    values = field.default
+                deleted_values[dest] = values
 
                 # call the "action" for the given attribute. This sets the right
                 # value in the `constructor_arguments` dictionary.
@@ -967,12 +990,12 @@ class ArgumentParser(argparse.ArgumentParser):
                     constructor_arguments=constructor_arguments,
                 )
 
-        # "Clean up" the Namespace by returning a new Namespace without the
-        # consumed attributes.
-        leftover_args = argparse.Namespace(**parsed_arg_values)
+        # The consumed attributes were popped from the Namespace above, so what's left are the
+        # leftover args. No need to create a new Namespace.
+        leftover_args = parsed_args
         if deleted_values:
-            logger.debug(f"deleted values: {deleted_values}")
-            logger.debug(f"leftover args: {leftover_args}")
+            logger.debug("deleted values: %s", deleted_values)
+            logger.debug("leftover args: %s", leftover_args)
 
         return leftover_args, constructor_arguments
 
@@ -1130,15 +1153,17 @@ def _create_dataclass_instance(
             arg_value = constructor_args[field_wrapper.name]
             default_value = field_wrapper.default
             logger.debug(
-                f"field {field_wrapper.name}, arg value: {arg_value}, "
-                f"default value: {default_value}"
+                "field %s, arg value: %s, default value: %s",
+                field_wrapper.name,
+                arg_value,
+                default_value,
             )
             if arg_value != default_value:
                 # Value is not the default value, so an argument must have been passed.
                 # Break, and return the instance.
                 break
         else:
-            logger.debug(f"All fields for {wrapper.dest} were either at their default, or None.")
+            logger.debug("All fields for %s were either at their default, or None.", wrapper.dest)
             return None
-    logger.debug(f"Calling constructor: {constructor}(**{constructor_args})")
+    logger.debug("Calling constructor: %s(**%s)", constructor, constructor_args)
     return constructor(**constructor_args)
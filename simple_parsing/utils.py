@@ -45,6 +45,31 @@ try:
 except ImportError:
     LiteralAlt = Literal  # type: ignore
 
+try:
+    from functools import cached_property
+except ImportError:
+    # NOTE: `functools.cached_property` was only added in Python 3.8.
+    class cached_property:  # type: ignore
+        """Minimal backport of `functools.cached_property` for Python 3.7.
+
+        The value is computed on first access and stored in the instance's `__dict__`, which then
+        shadows this (non-data) descriptor. Deleting the attribute clears the cached value.
+        """
+
+        def __init__(self, func: Callable):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __set_name__(self, owner: type, name: str) -> None:
+            self.attrname = name
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
 
 # NOTE: Copied from typing_inspect.
 def is_typevar(t) -> bool:
@@ -416,13 +441,51 @@ def is_dataclass_type_or_typevar(t: type) -> bool:
     return dataclasses.is_dataclass(t) or (is_typevar(t) and dataclasses.is_dataclass(get_bound(t)))
 
 
+# NOTE: On Python 3.9 and 3.10, parametrized builtin generics like `list[int]` are instances of
+# `type`, but `issubclass` raises a TypeError when given one.
+_generic_alias_types: tuple[type, ...] = (
+    (types.GenericAlias,) if sys.version_info[:2] >= (3, 9) else ()  # type: ignore
+)
+
+
+def _is_plain_class(t: type) -> bool:
+    """Returns whether `t` is a "real" class, which can safely be passed to `issubclass`."""
+    return isinstance(t, type) and not isinstance(t, _generic_alias_types)
+
+
 def is_enum(t: type) -> bool:
-    if inspect.isclass(t):
+    """Returns whether `t` is an Enum type.
+
+    >>> from typing import *
+    >>> class Color(Enum):
+    ...   RED = "red"
+    ...
+    >>> is_enum(Color)
+    True
+    >>> is_enum(str)
+    False
+    >>> is_enum(List[int])
+    False
+    """
+    if _is_plain_class(t):
+        # NOTE: `issubclass` is much cheaper than looking through the MRO.
         return issubclass(t, enum.Enum)
     return Enum in _mro(t)
 
 
 def is_bool(t: type) -> bool:
+    """Returns whether `t` is the bool type (or a subclass of it).
+
+    >>> from typing import *
+    >>> is_bool(bool)
+    True
+    >>> is_bool(int)
+    False
+    >>> is_bool(Optional[bool])
+    False
+    """
+    if _is_plain_class(t):
+        return issubclass(t, bool)
     return bool in _mro(t)
 
 
@@ -7,7 +7,7 @@ import inspect
 import sys
 import textwrap
 from dataclasses import MISSING
-from logging import getLogger
+from logging import DEBUG, getLogger
 from typing import Any, Callable, Generic, TypeVar, cast
 
 from typing_extensions import Literal
@@ -64,7 +64,6 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         self._destinations: list[str] = []
         self._required: bool = False
         self._explicit: bool = False
-        self._dest: str = ""
         self._children: list[DataclassWrapper] = []
         # the default value(s).
         # NOTE: This is a list only because of the `ConflictResolution.ALWAYS_MERGE` option.
@@ -77,6 +76,8 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
         for field in dataclass_fields:
             if not field.init or field.metadata.get("cmd", True) is False:
                 # Don't add arguments for this field.
+                # NOTE: Skipping these here means we don't create a FieldWrapper for them, so the
+                # code downstream doesn't need to check for `field.init` again.
                 continue
 
             if isinstance(field.type, str):
@@ -171,15 +172,22 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             else:
                 # a "normal" attribute
                 field_wrapper = self.field_wrapper_class(field, parent=self, prefix=self.prefix)
-                logger.debug(
-                    f"wrapped field at {field_wrapper.dest} has a default value of {field_wrapper.default}"
-                )
+                if logger.isEnabledFor(DEBUG):
+                    # NOTE: Only compute the `dest` and `default` when they will actually be logged.
+                    logger.debug(
+                        "wrapped field at %s has a default value of %s",
+                        field_wrapper.dest,
+                        field_wrapper.default,
+                    )
                 if field_default is not dataclasses.MISSING:
                     field_wrapper.set_default(field_default)
 
                 self.fields.append(field_wrapper)
 
-        logger.debug(f"The dataclass at attribute {self.dest} has default values: {self.defaults}")
+        # NOTE: Accessing `self.defaults` here also caches the default values of this wrapper.
+        logger.debug(
+            "The dataclass at attribute %s has default values: %s", self.dest, self.defaults
+        )
 
     def add_arguments(self, parser: argparse.ArgumentParser):
         from ..parsing import ArgumentParser
@@ -209,10 +217,11 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
                     f"--help text."
                 )
 
-            logger.info(f"group.add_argument(*{wrapped_field.option_strings}, **{arg_options})")
+            option_strings = wrapped_field.option_strings
+            logger.info("group.add_argument(*%s, **%s)", option_strings, arg_options)
             # TODO: Perhaps we could hook into the `action` that is returned here to know if the
             # flag was passed or not for a given field.
-            _ = group.add_argument(*wrapped_field.option_strings, **arg_options)
+            _ = group.add_argument(*option_strings, **arg_options)
 
     def equivalent_argparse_code(self, leading="group") -> str:
         code = ""
@@ -388,16 +397,18 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
 
     @property
     def dest(self):
-        lineage = []
-        parent = self.parent
-        while parent is not None:
-            lineage.append(parent.name)
-            parent = parent.parent
-        lineage = list(reversed(lineage))
-        lineage.append(self.name)
-        _dest = ".".join(lineage)
-        # logger.debug(f"getting dest, returning {_dest}")
-        return _dest
+        # NOTE: The name and the parent of the wrapper don't change, so this is only computed once.
+        if self._dest is None:
+            lineage = []
+            parent = self.parent
+            while parent is not None:
+                lineage.append(parent.name)
+                parent = parent.parent
+            lineage = list(reversed(lineage))
+            lineage.append(self.name)
+            self._dest = sys.intern(".".join(lineage))
+            # logger.debug(f"getting dest, returning {self._dest}")
+        return self._dest
 
     @property
     def destinations(self) -> list[str]:
@@ -437,6 +448,7 @@ class DataclassWrapper(Wrapper, Generic[DataclassT]):
             child.merge(other_child)
 
 
+@functools.lru_cache(2048)
 def _get_dataclass_fields(dataclass: type[Dataclass]) -> tuple[dataclasses.Field, ...]:
     # NOTE: `dataclasses.fields` method retrieves only `dataclasses._FIELD`
     # NOTE: but we also want to know about `dataclasses._FIELD_INITVAR`
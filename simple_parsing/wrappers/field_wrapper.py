@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import functools
 import inspect
 import sys
 import typing
@@ -15,7 +16,7 @@ from simple_parsing.help_formatter import TEMPORARY_TOKEN
 
 from .. import docstring, utils
 from ..helpers.custom_actions import BooleanOptionalAction
-from ..utils import Dataclass
+from ..utils import Dataclass, cached_property
 from .field_metavar import get_metavar
 from .field_parsing import get_parsing_fn
 from .wrapper import Wrapper
@@ -28,6 +29,27 @@ if typing.TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
+class _DefaultFactoryValue:
+    """Wraps the argparse default of a field whose default comes from its default factory.
+
+    Argparse puts the default as-is in the namespace when the argument isn't passed. Wrapping it
+    lets the `FieldWrapper` tell that case apart from a value passed on the command-line, and call
+    the default factory again for each parsed instance, rather than share the same value between
+    them. The wrapped value is what shows up in the --help text.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
 class ArgumentGenerationMode(Enum):
     """
     Enum for argument generation modes.
@@ -115,32 +137,41 @@ class FieldWrapper(Wrapper):
         self.field: dataclasses.Field = field
         self.prefix: str = prefix
         self._parent: Any = parent
-        # Holders used to 'cache' the properties.
-        # (could've used cached_property with Python 3.8).
+        # Holders used to 'cache' the properties that can also be set from the outside.
+        # NOTE: Properties that only depend on the field (e.g. `is_list`, `is_enum`) use
+        # `cached_property` instead, so the type introspection is only done once per field.
         self._option_strings: set[str] | None = None
         self._required: bool | None = None
-
-        try:
-            self._docstring = docstring.get_attribute_docstring(
-                self.parent.dataclass, self.field.name
-            )
-        except (SystemExit, Exception) as e:
-            logger.debug(f"Couldn't find attribute docstring for field {self.name}, {e}")
-            self._docstring = docstring.AttributeDocString()
-
         self._help: str | None = None
         self._metavar: str | None = None
         self._default: Any | list[Any] | None = None
+        # The value returned by the field's default factory, if it was called. This is only used
+        # for the --help text and to check if the value of the field is the default. Each parsed
+        # instance that uses the default gets a new value from the default factory instead.
+        self._default_factory_value: Any = dataclasses.MISSING
+        # Whether the last value returned by `default` came from the field's default factory.
+        self._default_is_from_factory: bool = False
         self._dest: str | None = None
-        # the argparse-related options:
-        self._arg_options: dict[str, Any] = {}
         self._dest_field: FieldWrapper | None = None
         self._type: type[Any] | None = None
 
         # stores the resulting values for each of the destination attributes.
         self._results: dict[str, Any] = {}
 
-    @property
+    @cached_property
+    def _docstring(self) -> docstring.AttributeDocString:
+        """The docstring of the wrapped field.
+
+        This is only retrieved when needed (e.g. when generating the help text), since it requires
+        inspecting the source code of the parent dataclass.
+        """
+        try:
+            return docstring.get_attribute_docstring(self.parent.dataclass, self.field.name)
+        except (SystemExit, Exception) as e:
+            logger.debug(f"Couldn't find attribute docstring for field {self.name}, {e}")
+            return docstring.AttributeDocString()
+
+    @cached_property
     def arg_options(self) -> dict[str, Any]:
         """Dictionary of values to be passed to the `add_argument` method.
 
@@ -159,17 +190,17 @@ class FieldWrapper(Wrapper):
         "store_false", the `type` argument autogenerated here shouldn't be
         passed to the constructor of the `argparse._StoreFalseAction`, so we
         discard it.
+
+        NOTE: This is computed once and cached. Setting the `default` or `required` attributes of
+        the wrapper clears the cached value, so that it gets recomputed on the next access.
         """
-        if self._arg_options:
-            return self._arg_options
         # get the auto-generated options.
         options = self.get_arg_options()
         # overwrite the auto-generated options with given ones, if any.
         options.update(self.custom_arg_options)
         # only keep the arguments used by the Action constructor.
         action = options.get("action", "store")
-        self._arg_options = only_keep_action_args(options, action)
-        return self._arg_options
+        return only_keep_action_args(options, action)
 
     def __call__(
         self,
@@ -197,20 +228,33 @@ class FieldWrapper(Wrapper):
 
         parser = cast(ArgumentParser, parser)
 
-        if self.is_reused:
-            values = self.duplicate_if_needed(values)
-            logger.debug(f"(replicated the parsed values: '{values}')")
+        if self.is_subgroup:
+            self._results = {}
+            logger.debug("Ignoring the FieldWrapper for subgroup at dest %s", self.dest)
+            return
+
+        if not self.is_reused:
+            # Fast path for the (most common) case where the field has a single destination: No
+            # need to create the list of destinations and then split each of them again.
+            parent_dest = self.parent.destinations[0]
+            attribute = self.name
+            if isinstance(values, _DefaultFactoryValue):
+                values = self.field.default_factory()
+            value = self.postprocess(values)
+            self._results = {f"{parent_dest}.{attribute}": value}
+            logger.debug("constructor_arguments[%s][%s] = %s", parent_dest, attribute, value)
+            constructor_arguments[parent_dest][attribute] = value
+            return
+
+        if isinstance(values, _DefaultFactoryValue):
+            values = [self.field.default_factory() for _ in self.destinations]
         else:
-            values = [values]
+            values = self.duplicate_if_needed(values)
+            logger.debug("(replicated the parsed values: '%s')", values)
 
         self._results = {}
 
         for destination, value in zip(self.destinations, values):
-
-            if self.is_subgroup:
-                logger.debug(f"Ignoring the FieldWrapper for subgroup at dest {self.dest}")
-                return
-
             parent_dest, attribute = utils.split_dest(destination)
             value = self.postprocess(value)
 
@@ -221,46 +265,37 @@ class FieldWrapper(Wrapper):
             #     constructor_arguments[parent_dest][attribute] = value
 
             # TODO: Need to decide which one to do here. Seems easier to always set all the values.
-            logger.debug(f"constructor_arguments[{parent_dest}][{attribute}] = {value}")
+            logger.debug("constructor_arguments[%s][%s] = %s", parent_dest, attribute, value)
             constructor_arguments[parent_dest][attribute] = value
 
-            if self.is_subgroup:
-                if not hasattr(namespace, "subgroups"):
-                    namespace.subgroups = {}
-
-                if isinstance(value, str) and value in self.subgroup_choices.keys():
-                    # We've just parsed the name of the chosen subgroup.
-                    # NOTE: There can't be any ambiguity here, since the keys of the dictionary are
-                    # string, and the values are always dataclass types. We don't need to worry
-                    # about having to deal with {"bob": "alice", "alice": "foo"}-type weirdness.
-                    namespace.subgroups[self.dest] = value
-                    logger.info(f"Chosen subgroup for '{self.dest}':  '{value}'")
-
     def get_arg_options(self) -> dict[str, Any]:
         """Create the `parser.add_arguments` kwargs for this field.
 
         TODO: Refactor this, following https://github.com/lebrice/SimpleParsing/issues/150
         """
-        if not self.field.init:
-            # Don't add command-line arguments for fields that have `init=False`.
-            return {}
+        # NOTE: The DataclassWrapper doesn't create FieldWrappers for fields with `init=False`, so
+        # we don't need to check for those here.
         _arg_options: dict[str, Any] = {}
+        # NOTE: `required` and `default` are computed from the field and its parent, so we only
+        # compute them once here.
+        required = self.required
+        default = self.default
 
         # Not sure why, but argparse doesn't allow using a different dest for a positional arg.
         # _Appears_ trivial to support within argparse.
         if not self.field.metadata.get("positional"):
-            _arg_options["required"] = self.required
+            _arg_options["required"] = required
             _arg_options["dest"] = self.dest
-        elif not self.required:
+        elif not required:
             # For positional arguments that aren't required we need to set
             # nargs='?' to make them optional.
             _arg_options["nargs"] = "?"
-        _arg_options["default"] = self.default
+        _arg_options["default"] = default
         _arg_options["metavar"] = get_metavar(self.type)
 
         if self.help:
             _arg_options["help"] = self.help
-        elif self.default is not None:
+        elif default is not None:
             # issue 64: Need to add a temporary 'help' string, so that the formatter
             # automatically adds the (default: '123'). We then remove it.
             _arg_options["help"] = TEMPORARY_TOKEN
@@ -274,7 +309,7 @@ class FieldWrapper(Wrapper):
             _arg_options["type"] = item_type
             _arg_options["choices"] = choices
             # TODO: Refactor this. is_choice and is_list are both contributing, so it's unclear.
-            if utils.is_list(self.type):
+            if self.is_list:
                 _arg_options["nargs"] = argparse.ZERO_OR_MORE
             # We use the default 'metavar' generated by argparse.
             _arg_options.pop("metavar", None)
@@ -342,20 +377,23 @@ class FieldWrapper(Wrapper):
             logger.debug(f"Adding an Enum attribute '{self.name}'")
             # we actually parse enums as string, and convert them back to enums
             # in the `process` method.
-            logger.debug(f"self.choices = {self.choices}")
             assert issubclass(self.type, Enum)
-            _arg_options["choices"] = list(e.name for e in self.type)
+            # NOTE: Reading the names from `__members__` is cheaper than iterating over the enum.
+            # Aliases are skipped, like they are when iterating over the enum.
+            _arg_options["choices"] = [
+                name for name, member in self.type.__members__.items() if member.name == name
+            ]
             _arg_options["type"] = str
             # if the default value is an Enum, we convert it to a string.
-            if self.default:
+            if default:
 
                 def enum_to_str(e):
                     return e.name if isinstance(e, Enum) else e
 
                 if self.is_reused:
-                    _arg_options["default"] = [enum_to_str(default) for default in self.default]
+                    _arg_options["default"] = [enum_to_str(d) for d in default]
                 else:
-                    _arg_options["default"] = enum_to_str(self.default)
+                    _arg_options["default"] = enum_to_str(default)
 
         elif self.is_list:
             logger.debug(f"Adding a List attribute '{self.name}': {self.type}")
@@ -370,7 +408,7 @@ class FieldWrapper(Wrapper):
             else:
                 _arg_options["type"] = utils.get_argparse_type_for_container(self.type)
 
-        elif utils.is_tuple(self.type):
+        elif self.is_tuple:
             logger.debug(f"Adding a Tuple attribute '{self.name}' with type {self.type}")
             _arg_options["nargs"] = utils.get_container_nargs(self.type)
             _arg_options["type"] = get_parsing_fn(self.type)
@@ -380,10 +418,9 @@ class FieldWrapper(Wrapper):
                 type_fn.__name__ = utils.get_type_name(self.type)
                 _arg_options["type"] = type_fn
 
-        elif utils.is_bool(self.type):
+        elif self.is_bool:
             if self.is_reused:
                 _arg_options["type"] = utils.str2bool
-                _arg_options["type"].__name__ = "bool"
                 _arg_options["metavar"] = "bool"
                 _arg_options["nargs"] = "?"
             else:
@@ -404,11 +441,14 @@ class FieldWrapper(Wrapper):
             _arg_options["type"] = self.custom_arg_options.get("type", get_parsing_fn(self.type))
 
         if self.is_reused:
-            if self.required:
+            if required:
                 _arg_options["nargs"] = "+"
             else:
                 _arg_options["nargs"] = "*"
 
+        if self._default_is_from_factory:
+            _arg_options["default"] = _DefaultFactoryValue(_arg_options["default"])
+
         return _arg_options
 
     def duplicate_if_needed(self, parsed_values: Any) -> list[Any]:
@@ -428,15 +468,15 @@ class FieldWrapper(Wrapper):
             List[Any]: The list of parsed values, of the right length.
         """
         num_instances_to_parse = len(self.destinations)
-        logger.debug(f"num to parse: {num_instances_to_parse}")
-        logger.debug(f"(raw) parsed values: '{parsed_values}'")
+        logger.debug("num to parse: %s", num_instances_to_parse)
+        logger.debug("(raw) parsed values: '%s'", parsed_values)
 
         assert self.is_reused
         assert (
             num_instances_to_parse > 1
         ), "multiple is true but we're expected to instantiate only one instance"
 
-        if utils.is_list(self.type) and isinstance(parsed_values, tuple):
+        if self.is_list and isinstance(parsed_values, tuple):
             parsed_values = list(parsed_values)
 
         if not self.is_tuple and not self.is_list and isinstance(parsed_values, list):
@@ -473,74 +513,52 @@ class FieldWrapper(Wrapper):
         Returns:
             Any: The processed value
         """
+        return self._postprocessing_fn(raw_parsed_value)
+
+    @cached_property
+    def _postprocessing_fn(self) -> Callable[[Any], Any]:
+        """The function used by `postprocess` to convert the raw parsed values for this field.
+
+        The conversion only depends on the type of the field, so it is selected once, rather than
+        every time a value is parsed.
+        """
         if self.is_enum:
-            logger.debug(
-                f"field postprocessing for Enum field '{self.name}' with value:"
-                f" {raw_parsed_value}'"
-            )
-            if isinstance(raw_parsed_value, str):
-                raw_parsed_value = self.type[raw_parsed_value]  # type: ignore
-            return raw_parsed_value
+            return _make_enum_postprocess(self.type)
 
         elif self.is_choice:
             choice_dict = self.choice_dict
-            if choice_dict:
-                key_type = type(next(iter(choice_dict.keys())))
-                if self.is_list and isinstance(raw_parsed_value[0], key_type):
-                    return [choice_dict[value] for value in raw_parsed_value]
-                elif isinstance(raw_parsed_value, key_type):
-                    return choice_dict[raw_parsed_value]
-            return raw_parsed_value
+            if not choice_dict:
+                return _identity
+            return _make_choice_postprocess(choice_dict, is_list=self.is_list)
 
         elif self.is_tuple:
-            logger.debug("we're parsing a tuple!")
             # argparse always returns lists by default. If the field was of a
             # Tuple type, we just transform the list to a Tuple.
-            if not isinstance(raw_parsed_value, tuple):
-                return tuple(raw_parsed_value)
+            return _to_tuple
 
-        elif self.is_bool:
-            return raw_parsed_value
+        elif self.is_bool or self.is_subparser:
+            return _identity
 
         elif self.is_list:
-            if isinstance(raw_parsed_value, tuple):
-                return list(raw_parsed_value)
-            else:
-                return raw_parsed_value
-
-        elif self.is_subparser:
-            return raw_parsed_value
+            return _tuple_to_list
 
         elif utils.is_optional(self.type):
             item_type = utils.get_args(self.type)[0]
-            if utils.is_tuple(item_type) and isinstance(raw_parsed_value, list):
-                # TODO: Make sure that this doesn't cause issues with NamedTuple types.
-                return tuple(raw_parsed_value)
+            if not utils.is_tuple(item_type):
+                return _identity
+            # TODO: Make sure that this doesn't cause issues with NamedTuple types.
+            return _list_to_tuple
 
         elif self.type not in utils.builtin_types:
-            # TODO: what if we actually got an auto-generated parsing function?
-            try:
-                # if the field has a weird type, we try to call it directly.
-                return self.type(raw_parsed_value)
-            except Exception as e:
-                logger.debug(
-                    f"Unable to instantiate the field '{self.name}' of type "
-                    f"'{self.type}' by using the type as a constructor. "
-                    f"Returning the raw parsed value instead "
-                    f"({raw_parsed_value}, of type {type(raw_parsed_value)}). "
-                    f"(Caught Exception: {e})"
-                )
-                return raw_parsed_value
+            return _make_constructor_postprocess(self.type, field_name=self.name)
 
-        logger.debug(
-            f"field postprocessing for field {self.name} of type '{self.type}' and with "
-            f"value '{raw_parsed_value}'"
-        )
-        return raw_parsed_value
+        return _identity
 
     @property
     def is_reused(self) -> bool:
-        return len(self.destinations) > 1
+        # NOTE: Equivalent to `len(self.destinations) > 1`, without creating the list of
+        # destinations.
+        return self.parent.multiple
 
     @property
     def action(self) -> str | type[argparse.Action]:
@@ -553,7 +571,7 @@ class FieldWrapper(Wrapper):
             return self.action
         return self.action.__name__
 
-    @property
+    @cached_property
     def custom_arg_options(self) -> dict[str, Any]:
         """Custom argparse options that overwrite those in `arg_options`.
 
@@ -561,7 +579,10 @@ class FieldWrapper(Wrapper):
         that would usually be passed to the parser.add_argument(
         *option_strings, **kwargs) method.
         """
-        return self.field.metadata.get("custom_args", {})
+        # NOTE: This is cached so that fields without custom args don't create a new empty dict
+        # each time this is accessed (e.g. from `action`, `nargs`, `required`).
+        custom_args = self.field.metadata.get("custom_args")
+        return custom_args if custom_args is not None else {}
 
     @property
     def destinations(self) -> list[str]:
@@ -670,13 +691,12 @@ class FieldWrapper(Wrapper):
     @property
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
-        self._dest = super().dest
         # TODO: If a custom `dest` was passed, and it is a `Field` instance,
         # find the corresponding FieldWrapper and use its `dest` instead of ours.
         if self.dest_field:
-            self._dest = self.dest_field.dest
             self.custom_arg_options.pop("dest", None)
-        return self._dest
+            return self.dest_field.dest
+        return super().dest
 
     @property
     def is_proxy(self) -> bool:
@@ -725,6 +745,7 @@ class FieldWrapper(Wrapper):
         if it has a default value
         """
 
+        self._default_is_from_factory = False
         if self._default is not None:
             # If a default value was set manually from the outside (e.g. from the DataclassWrapper)
             # then use that value.
@@ -757,15 +778,12 @@ class FieldWrapper(Wrapper):
         elif self.field.default is not dataclasses.MISSING:
             default = self.field.default
         elif self.field.default_factory is not dataclasses.MISSING:
-            # Use the _default attribute to keep the result, so we can avoid calling the default
-            # factory another time.
-            # TODO: If the default factory is a function that returns None, it will still get
-            # called multiple times. We need to set a sentinel value as the initial value of the
-            # self._default attribute, so that we can correctly check whether we've already called
-            # the default_factory before.
-            if self._default is None:
-                self._default = self.field.default_factory()
-            default = self._default
+            # Keep the result, so we only call the default factory when the default is actually
+            # needed, and at most once (even if it returns None).
+            if self._default_factory_value is dataclasses.MISSING:
+                self._default_factory_value = self.field.default_factory()
+            default = self._default_factory_value
+            self._default_is_from_factory = True
         # field doesn't have a default value set.
         elif self.action == "store_true":
             default = False
@@ -798,6 +816,8 @@ class FieldWrapper(Wrapper):
     def set_default(self, value: Any):
         logger.debug(f"The field {self.name} has its default manually set to a value of {value}.")
         self._default = value
+        # Invalidate the cached `arg_options`, since they depend on the default value.
+        self.__dict__.pop("arg_options", None)
 
     @property
     def required(self) -> bool:
@@ -829,6 +849,7 @@ class FieldWrapper(Wrapper):
     @required.setter
     def required(self, value: bool):
         self._required = value
+        self.__dict__.pop("arg_options", None)
 
     @property
     def type(self) -> type[Any]:
@@ -854,7 +875,7 @@ class FieldWrapper(Wrapper):
     def __str__(self):
         return f"""<FieldWrapper for field '{self.dest}'>"""
 
-    @property
+    @cached_property
     def is_choice(self) -> bool:
         return self.choices is not None
 
@@ -929,35 +950,35 @@ class FieldWrapper(Wrapper):
     def name(self) -> str:
         return self.field.name
 
-    @property
+    @cached_property
     def is_list(self):
         return utils.is_list(self.type)
 
-    @property
+    @cached_property
     def is_enum(self) -> bool:
         return utils.is_enum(self.type)
 
-    @property
+    @cached_property
     def is_tuple(self) -> bool:
         return utils.is_tuple(self.type)
 
-    @property
+    @cached_property
     def is_bool(self) -> bool:
         return utils.is_bool(self.type)
 
-    @property
+    @cached_property
     def is_optional(self) -> bool:
         return utils.is_optional(self.field.type)
 
-    @property
+    @cached_property
     def is_union(self) -> bool:
         return utils.is_union(self.field.type)
 
-    @property
+    @cached_property
     def is_subparser(self) -> bool:
         return utils.is_subparser_field(self.field) and "subgroups" not in self.field.metadata
 
-    @property
+    @cached_property
     def is_subgroup(self) -> bool:
         return "subgroups" in self.field.metadata
 
@@ -1039,6 +1060,98 @@ class FieldWrapper(Wrapper):
         return f"group.add_argument(*{self.option_strings}, **{arg_options_string})"
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_tuple(value: Any) -> Any:
+    if not isinstance(value, tuple):
+        return tuple(value)
+    return value
+
+
+def _list_to_tuple(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _tuple_to_list(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _make_enum_postprocess(enum_type: type[Enum]) -> Callable[[Any], Any]:
+    def _postprocess_enum(value: Any) -> Any:
+        if isinstance(value, str):
+            return enum_type[value]
+        return value
+
+    return _postprocess_enum
+
+
+def _make_choice_postprocess(choice_dict: dict, is_list: bool) -> Callable[[Any], Any]:
+    key_type = type(next(iter(choice_dict.keys())))
+
+    def _postprocess_choice(value: Any) -> Any:
+        if is_list and isinstance(value[0], key_type):
+            return [choice_dict[v] for v in value]
+        elif isinstance(value, key_type):
+            return choice_dict[value]
+        return value
+
+    return _postprocess_choice
+
+
+def _make_constructor_postprocess(field_type: type, field_name: str) -> Callable[[Any], Any]:
+    def _postprocess_with_constructor(value: Any) -> Any:
+        # TODO: what if we actually got an auto-generated parsing function?
+        try:
+            # if the field has a weird type, we try to call it directly.
+            return field_type(value)
+        except Exception as e:
+            logger.debug(
+                f"Unable to instantiate the field '{field_name}' of type "
+                f"'{field_type}' by using the type as a constructor. "
+                f"Returning the raw parsed value instead "
+                f"({value}, of type {type(value)}). "
+                f"(Caught Exception: {e})"
+            )
+            return value
+
+    return _postprocess_with_constructor
+
+
+# TODO: explicitly test these custom actions?
+_argparse_action_classes: dict[str, type[argparse.Action]] = {
+    "store": argparse._StoreAction,
+    "store_const": argparse._StoreConstAction,
+    "store_true": argparse._StoreTrueAction,
+    "store_false": argparse._StoreFalseAction,
+    "append": argparse._AppendAction,
+    "append_const": argparse._AppendConstAction,
+    "count": argparse._CountAction,
+    "help": argparse._HelpAction,
+    "version": argparse._VersionAction,
+    "parsers": argparse._SubParsersAction,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_constructor_args(action_class: type[argparse.Action]) -> tuple[str, ...] | None:
+    """Returns the names of the arguments of the Action class constructor, or None if it takes
+    variable arguments.
+
+    NOTE: Inspecting the signature is relatively slow, and the same few action classes are used
+    for every argument of every parser, so the result is cached.
+    """
+    argspec = inspect.getfullargspec(action_class)
+    if argspec.varargs is not None or argspec.varkw is not None:
+        return None
+    return tuple(argspec.args)
+
+
 def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[str, Any]:
     """Remove all the arguments in `options` that aren't required by the Action.
 
@@ -1055,34 +1168,21 @@ def only_keep_action_args(options: dict[str, Any], action: str | Any) -> dict[st
     Dict[str, Any]
         [description]
     """
-    # TODO: explicitly test these custom actions?
-    argparse_action_classes: dict[str, type[argparse.Action]] = {
-        "store": argparse._StoreAction,
-        "store_const": argparse._StoreConstAction,
-        "store_true": argparse._StoreTrueAction,
-        "store_false": argparse._StoreFalseAction,
-        "append": argparse._AppendAction,
-        "append_const": argparse._AppendConstAction,
-        "count": argparse._CountAction,
-        "help": argparse._HelpAction,
-        "version": argparse._VersionAction,
-        "parsers": argparse._SubParsersAction,
-    }
-    if action not in argparse_action_classes:
+    if action not in _argparse_action_classes:
         # the provided `action` is not a standard argparse-action.
         # We don't remove any of the provided options.
         return options
 
     # Remove all the keys that aren't needed by the action constructor:
-    action_class = argparse_action_classes[action]
-    argspec = inspect.getfullargspec(action_class)
+    action_class = _argparse_action_classes[action]
+    constructor_args = _get_constructor_args(action_class)
 
-    if argspec.varargs is not None or argspec.varkw is not None:
+    if constructor_args is None:
         # if the constructor takes variable arguments, pass all the options.
         logger.debug("Constructor takes var args. returning all options.")
         return options
 
-    args_to_keep = argspec.args + ["action"]
+    args_to_keep = constructor_args + ("action",)
 
     kept_options, deleted_options = utils.keep_keys(options, args_to_keep)
     if deleted_options:
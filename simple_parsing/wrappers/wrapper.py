@@ -1,5 +1,6 @@
 """Abstract Wrapper base-class for the FieldWrapper and DataclassWrapper."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
@@ -25,9 +26,12 @@ class Wrapper(ABC):
     @property
     def dest(self) -> str:
         """Where the attribute will be stored in the Namespace."""
-        lineage_names: List[str] = [w.name for w in self.lineage()]
-        self._dest = ".".join(reversed([self.name] + lineage_names))
-        assert self._dest is not None
+        # NOTE: The name and the parent of a wrapper don't change after it is created, so the
+        # `dest` is only computed once. It is interned, since it is used as a key in dicts and in
+        # the Namespace (e.g. when filling the constructor arguments after each parse).
+        if self._dest is None:
+            lineage_names: List[str] = [w.name for w in self.lineage()]
+            self._dest = sys.intern(".".join(reversed([self.name] + lineage_names)))
         return self._dest
 
     def lineage(self) -> List["Wrapper"]:
@@ -1,5 +1,6 @@
 import argparse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from simple_parsing import ArgumentParser
 
@@ -82,3 +83,89 @@ def test_partial_default_dict_argument(simple_attribute, silent):
         parser.parse_args(shlex.split(f"--a {passed_value}"))
     with raises_missing_required_arg():
         parser.parse_args("")
+
+
+def test_default_factory_is_only_called_when_needed():
+    calls: List[int] = []
+
+    def default_factory() -> Optional[int]:
+        calls.append(1)
+        return None
+
+    @dataclass
+    class SomeClass:
+        a: Optional[int] = field(default_factory=default_factory)
+
+    parser = ArgumentParser()
+    parser.add_arguments(SomeClass, dest="some_class")
+    # The default factory isn't called when creating the wrappers.
+    assert calls == []
+
+    assert parser.parse_args(shlex.split("--a 1")) == argparse.Namespace(some_class=SomeClass(a=1))
+    # Called once, to create the default value of the argument.
+    assert len(calls) == 1
+    assert parser.parse_args("") == argparse.Namespace(some_class=SomeClass(a=None))
+    # Called once more, to create the value of the parsed instance.
+    assert len(calls) == 2
+
+
+def test_default_factory_value_is_not_shared_between_instances():
+    @dataclass
+    class SomeClass:
+        a: List[int] = field(default_factory=list)
+
+    parser = ArgumentParser()
+    parser.add_arguments(SomeClass, dest="some_class")
+
+    first = parser.parse_args("").some_class
+    second = parser.parse_args("").some_class
+    assert first == second == SomeClass(a=[])
+    first.a.append(1)
+    assert second.a == []
+
+
+def test_default_factory_not_called_for_value_equal_to_default():
+    """A value passed on the command-line that is equal to (or even the same object as) the
+    default value must be kept, and must not cause the default factory to be called again."""
+    calls: List[int] = []
+
+    def default_factory() -> int:
+        calls.append(1)
+        return len(calls) - 1
+
+    @dataclass
+    class SomeClass:
+        seed: int = field(default_factory=default_factory)
+
+    parser = ArgumentParser()
+    parser.add_arguments(SomeClass, dest="some_class")
+
+    assert parser.parse_args(shlex.split("--seed 0")) == argparse.Namespace(
+        some_class=SomeClass(seed=0)
+    )
+    assert parser.parse_args(shlex.split("--seed 0")) == argparse.Namespace(
+        some_class=SomeClass(seed=0)
+    )
+    # Only called once, to create the default value of the argument.
+    assert len(calls) == 1
+
+
+def test_mutating_parsed_default_factory_value_doesnt_change_the_default():
+    @dataclass
+    class Child:
+        x: int = 0
+        xs: List[int] = field(default_factory=list)
+
+    @dataclass
+    class Config:
+        child: Optional[Child] = None
+
+    parser = ArgumentParser()
+    parser.add_arguments(Config, dest="config")
+
+    config = parser.parse_args(shlex.split("--x 3")).config
+    assert config == Config(child=Child(x=3, xs=[]))
+    config.child.xs.append(99)
+
+    assert parser.parse_args("") == argparse.Namespace(config=Config(child=None))
+    assert "(default: [99])" not in parser.format_help()
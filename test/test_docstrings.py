@@ -218,3 +218,55 @@ def test_help_takes_value_from_docstring():
     assert get_attribute_docstring(Args, "verbose") == AttributeDocString(
         desc_from_cls_docstring="Display logs",
     )
+
+
+def test_field_docstring_is_retrieved_lazily(monkeypatch):
+    """The docstring of a field is only retrieved when it is needed, e.g. for the help text."""
+    from simple_parsing import ArgumentParser
+    from simple_parsing import docstring as docstring_module
+
+    calls: List[str] = []
+    get_attribute_docstring_ = docstring_module.get_attribute_docstring
+
+    def _spy(dataclass, field_name, *args, **kwargs):
+        calls.append(field_name)
+        return get_attribute_docstring_(dataclass, field_name, *args, **kwargs)
+
+    monkeypatch.setattr(docstring_module, "get_attribute_docstring", _spy)
+
+    parser = ArgumentParser()
+    parser.add_arguments(Base, "base")
+    assert calls == []
+
+    field_wrapper = parser._wrappers[0].fields[0]
+    assert field_wrapper.help == "docstring for attribute 'a'"
+    assert calls == ["a"]
+    # The result is cached on the wrapper.
+    _ = field_wrapper.help, field_wrapper._docstring
+    assert calls == ["a"]
+
+
+def test_source_is_parsed_once_per_dataclass():
+    """The docstrings of all the fields of a class are extracted in one pass and cached."""
+    from simple_parsing.docstring import _get_attribute_docstrings
+
+    @dataclass
+    class Foo:
+        a: int = 1  # comment for a
+        b: int = 2  # comment for b
+
+    _get_attribute_docstrings.cache_clear()
+    assert get_attribute_docstring(Foo, "a").comment_inline == "comment for a"
+    assert get_attribute_docstring(Foo, "b").comment_inline == "comment for b"
+    cache_info = _get_attribute_docstrings.cache_info()
+    # The source of `Foo` is only parsed once. (`object` isn't inspected.)
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_accumulating_from_bases_doesnt_modify_cached_docstrings():
+    # `Extended.a` accumulates parts of its docstring from `Base.a`.
+    extended_a = get_attribute_docstring(Extended, "a")
+    extended_a.comment_above = "modified"
+    assert get_attribute_docstring(Extended, "a").comment_above != "modified"
+    assert get_attribute_docstring(Base, "a").comment_above != "modified"
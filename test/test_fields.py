@@ -80,3 +80,41 @@ def test_generated_options_from_annotation(annotation: Type, expected_options: D
     # actual_options = get_argparse_options_for_annotation(annotation)
     # for option, expected_value in expected_options.items():
     #     assert actual_options[option] == expected_value
+
+
+def test_arg_options_are_cached_and_invalidated():
+    @dataclass
+    class A:
+        a: int = 1
+
+    parser = ArgumentParser()
+    parser.add_arguments(A, "a")
+    field_wrapper = parser._wrappers[0].fields[0]
+
+    arg_options = field_wrapper.arg_options
+    assert arg_options["default"] == 1
+    assert field_wrapper.arg_options is arg_options
+
+    # Changing the default or `required` clears the cached options.
+    field_wrapper.set_default(2)
+    assert field_wrapper.arg_options is not arg_options
+    assert field_wrapper.arg_options["default"] == 2
+
+    field_wrapper.required = True
+    assert field_wrapper.arg_options["required"] is True
+
+
+def test_enum_choices_dont_include_aliases():
+    class Mode(Enum):
+        train = "train"
+        eval = "eval"
+        evaluate = "eval"  # alias for `eval`.
+
+    @dataclass
+    class A:
+        mode: Mode = Mode.train
+
+    parser = ArgumentParser()
+    parser.add_arguments(A, "a")
+    assert parser._wrappers[0].fields[0].arg_options["choices"] == ["train", "eval"]
+    assert parser.parse_args(["--mode", "eval"]).a == A(mode=Mode.eval)